@@ -1,18 +1,138 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+import orjson
+try:
+    import uvloop # Faster event loop for the concurrent candle fetcher; not available on Windows
+except ImportError:
+    uvloop = None
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 from datetime import datetime, timedelta, timezone
 import time
+import random
 import os
+from operator import itemgetter
+from typing import Optional
 
 # --- Configuration ---
 BASE_URL = "https://api.india.delta.exchange" 
 
+# Earliest date Delta Exchange holds historical data for
+DELTA_EPOCH = datetime(2020, 3, 30, tzinfo=timezone.utc)
+
+# --- Shared HTTP session ---
+# Reusing one session keeps connections alive between calls instead of paying
+# for a fresh DNS lookup + TLS handshake on every request.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=5, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# --- Response cache for products / tickers ---
+CACHE_DIR = ".cache" # Holds '<name>.json' bodies and '<name>.etag' validators
+
+# --- Concurrent candle fetching ---
+MAX_CONCURRENT_REQUESTS = 8 # Upper bound on in-flight candle requests
+MAX_RETRIES = 5 # Retries per chunk on 429 / 5xx responses
+RETRY_BACKOFF_SECONDS = 0.5 # Base delay, doubled after every failed attempt
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RATE_LIMIT_JITTER_SECONDS = 0.05 # Random spread added to waits so chunks don't resume in lockstep
+
+# Fixed-stride record layout used to accumulate candles from all chunks
+CANDLE_DTYPE = np.dtype([
+    ('time', 'i8'), ('open', 'f8'), ('high', 'f8'),
+    ('low', 'f8'), ('close', 'f8'), ('volume', 'f8'),
+])
+CANDLE_VALUE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+CANDLE_FIELD_GETTER = itemgetter(*CANDLE_DTYPE.names)
+
+# Candle duration in seconds for each resolution accepted by /v2/history/candles
+RESOLUTION_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '12h': 43200,
+    '1d': 86400, '1w': 604800,
+}
+
 # --- API Keys (not strictly needed for public OHLC data or top symbols) ---
 # For public historical data (like candles) and fetching tickers, API key/secret
 # are usually NOT required. They are only for authenticated actions
 # (e.g., placing orders, getting balances).
 
 
+def write_file_atomically(path: str, data: bytes) -> None:
+    """
+    Writes `data` to `path` via a temporary file and os.replace, so readers only ever
+    see the old or the complete new contents.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def get_json_with_etag_cache(endpoint: str, cache_name: str) -> dict:
+    """
+    GETs a JSON endpoint, revalidating a cached copy on disk with If-None-Match.
+
+    On a 304 the cached body is returned without transferring it again; if that copy
+    cannot be read, the endpoint is fetched again unconditionally. On a 200 the body
+    and its ETag are written to CACHE_DIR for the next run.
+
+    Args:
+        endpoint (str): The full URL to fetch.
+        cache_name (str): Base filename for the cached body and ETag.
+
+    Returns:
+        dict: The parsed JSON response.
+    """
+    body_path = os.path.join(CACHE_DIR, f"{cache_name}.json")
+    etag_path = os.path.join(CACHE_DIR, f"{cache_name}.etag")
+
+    headers = {}
+    if os.path.exists(body_path) and os.path.exists(etag_path):
+        with open(etag_path, 'r') as f:
+            headers['If-None-Match'] = f.read().strip()
+
+    response = SESSION.get(endpoint, headers=headers, timeout=10)
+    response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+
+    if response.status_code == 304:
+        try:
+            with open(body_path, 'rb') as f:
+                cached_response = orjson.loads(f.read())
+            print(f"  {cache_name} not modified since last run; using cached copy.")
+            return cached_response
+        except (OSError, orjson.JSONDecodeError) as e:
+            print(f"  Warning: Cached {cache_name} could not be read ({e}). Fetching a fresh copy.")
+            response = SESSION.get(endpoint, timeout=10)
+            response.raise_for_status()
+
+    json_response = orjson.loads(response.content)
+
+    etag = response.headers.get('ETag')
+    if etag:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Drop the old validator first and write the new one last, so an ETag on
+            # disk always matches a complete body.
+            if os.path.exists(etag_path):
+                os.remove(etag_path)
+            write_file_atomically(body_path, response.content)
+            write_file_atomically(etag_path, etag.encode())
+        except OSError as e:
+            print(f"  Warning: Could not write {cache_name} cache: {e}")
+
+    return json_response
+
+
 def get_all_products(base_url: str) -> list:
     """
     Retrieves a list of all tradable products/symbols from Delta Exchange.
@@ -27,9 +147,7 @@ def get_all_products(base_url: str) -> list:
     endpoint = f"{base_url}/v2/products"
     try:
         print(f"Fetching all products from: {endpoint}...")
-        response = requests.get(endpoint, timeout=10)
-        response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        json_response = response.json()
+        json_response = get_json_with_etag_cache(endpoint, 'products')
 
         if 'result' in json_response and isinstance(json_response['result'], list):
             products = json_response['result']
@@ -60,9 +178,7 @@ def get_all_tickers(base_url: str) -> list:
     endpoint = f"{base_url}/v2/tickers"
     try:
         print(f"Fetching all tickers from: {endpoint}...")
-        response = requests.get(endpoint, timeout=10)
-        response.raise_for_status()
-        json_response = response.json()
+        json_response = get_json_with_etag_cache(endpoint, 'tickers')
 
         if 'result' in json_response and isinstance(json_response['result'], list):
             tickers = json_response['result']
@@ -96,25 +212,175 @@ def get_top_n_symbols_by_volume(n: int = 10) -> pd.DataFrame:
         print("Could not retrieve any ticker data.")
         return pd.DataFrame()
 
-    df = pd.DataFrame(tickers)
-    
     VOLUME_COLUMN = 'turnover_usd' 
-    
-    if VOLUME_COLUMN not in df.columns:
+
+    desired_cols = ['symbol', VOLUME_COLUMN, 'volume', 'last_price', 'close', 'open', 'high', 'low']
+    existing_cols = [col for col in desired_cols if any(col in t for t in tickers)]
+
+    if VOLUME_COLUMN not in existing_cols:
         print(f"Error: '{VOLUME_COLUMN}' column not found in ticker data. Cannot sort by volume.")
-        print("Available ticker columns:", df.columns.tolist())
+        print("Available ticker columns:", list(dict.fromkeys(k for t in tickers for k in t)))
         return pd.DataFrame()
 
-    df[VOLUME_COLUMN] = pd.to_numeric(df[VOLUME_COLUMN], errors='coerce')
-    df.dropna(subset=[VOLUME_COLUMN], inplace=True)
-    df_sorted = df.sort_values(by=VOLUME_COLUMN, ascending=False)
-    
-    top_n_symbols = df_sorted.head(n).copy()
-    
-    desired_cols = ['symbol', VOLUME_COLUMN, 'volume', 'last_price', 'close', 'open', 'high', 'low']
-    existing_cols = [col for col in desired_cols if col in top_n_symbols.columns]
-    
-    return top_n_symbols[existing_cols]
+    # Keep only the output columns while building the frame, so the result never
+    # needs a list-based column selection afterwards.
+    records = [{k: t.get(k) for k in existing_cols} for t in tickers]
+    df = pd.DataFrame(records, columns=existing_cols)
+
+    # Coerce and filter the volume column in a single numpy pass rather than
+    # materializing a new frame for dropna, sort and head.
+    vals = pd.to_numeric(df[VOLUME_COLUMN], errors='coerce').to_numpy(dtype=np.float64)
+    df[VOLUME_COLUMN] = vals
+    finite_idx = np.flatnonzero(~np.isnan(vals))
+    finite_vals = vals[finite_idx]
+
+    n = max(0, min(n, len(finite_vals)))
+    if n == 0:
+        return df.iloc[:0]
+
+    # Partially select the top N (O(N)) and only fully order those N rows,
+    # instead of sorting every ticker just to keep the head.
+    if n < len(finite_vals):
+        top_idx = np.argpartition(-finite_vals, n - 1)[:n]
+    else:
+        top_idx = np.arange(len(finite_vals))
+    top_idx = top_idx[np.argsort(-finite_vals[top_idx], kind='stable')]
+
+    return df.take(finite_idx[top_idx])
+
+
+def get_rate_limit_delay(headers) -> float:
+    """
+    Returns how long to wait before the next request based on the rate-limit headers.
+
+    Only waits when the remaining request budget is (nearly) exhausted; otherwise,
+    or when the response carries no rate-limit headers, returns 0.
+    """
+    remaining_header = headers.get("X-RateLimit-Remaining")
+    if remaining_header is None:
+        return 0.0
+    try:
+        remaining = int(remaining_header)
+        reset = float(headers.get("X-RateLimit-Reset", 0))
+    except ValueError:
+        return 0.0
+
+    if remaining > 1:
+        return 0.0
+    return max(0.0, reset - time.time())
+
+
+async def wait_for_rate_limit(rate_limit: dict) -> None:
+    """
+    Sleeps until the shared rate-limit pause (if any) is over. A small random jitter is
+    added so the paused workers don't all resume in the same instant.
+    """
+    wait = rate_limit['resume_at'] - time.time()
+    if wait > 0:
+        await asyncio.sleep(wait + random.uniform(0, RATE_LIMIT_JITTER_SECONDS))
+
+
+async def fetch_candle_chunk(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    rate_limit: dict,
+    symbol: str,
+    resolution: str,
+    chunk_start: int,
+    chunk_end: int,
+    limit_per_request: int
+) -> Optional[list]:
+    """
+    Fetches a single window of candles, retrying with exponential backoff on 429 / 5xx.
+
+    Args:
+        session (aiohttp.ClientSession): The shared HTTP session.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+        rate_limit (dict): Shared state; 'resume_at' is the UNIX time before which no worker
+                           may send a request.
+        symbol (str): The trading symbol (e.g., "BTCUSD").
+        resolution (str): The candle timeframe (e.g., "1m", "1h", "1d").
+        chunk_start (int): Window start as a UNIX timestamp (seconds).
+        chunk_end (int): Window end as a UNIX timestamp (seconds).
+        limit_per_request (int): Max number of candles to request.
+
+    Returns:
+        Optional[list]: The candles returned for this window (possibly empty if the window
+                        has no data), or None if the window could not be fetched.
+    """
+    params = {
+        'symbol': symbol,
+        'resolution': resolution,
+        'start': chunk_start,
+        'end': chunk_end,
+        'limit': limit_per_request
+    }
+    chunk_label = datetime.fromtimestamp(chunk_start, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            await wait_for_rate_limit(rate_limit)
+            try:
+                async with session.get(f"{BASE_URL}/v2/history/candles", params=params) as response:
+                    if response.status in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                        delay = RETRY_BACKOFF_SECONDS * (2 ** attempt) + random.uniform(0, RATE_LIMIT_JITTER_SECONDS)
+                        print(f"  HTTP {response.status} for chunk {chunk_label}. Retrying in {delay:.1f}s...")
+                        await asyncio.sleep(delay)
+                        continue
+                    response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
+                    json_response = orjson.loads(await response.read())
+                    rate_limit_delay = get_rate_limit_delay(response.headers)
+
+                # Publish the pause to every worker, not just this one; each checks it
+                # before its next request.
+                if rate_limit_delay > 0:
+                    resume_at = time.time() + rate_limit_delay
+                    if resume_at > rate_limit['resume_at']:
+                        print(f"  Rate limit nearly exhausted. Pausing all requests for {rate_limit_delay:.2f}s...")
+                        rate_limit['resume_at'] = resume_at
+
+                if 'result' in json_response and isinstance(json_response['result'], list):
+                    candles_page = json_response['result']
+                    print(f"  Fetched {len(candles_page)} candles in chunk from {chunk_label}.")
+                    return candles_page
+                print(f"  Error: Unexpected response format for chunk {chunk_label}. Received: {json_response}")
+                return None
+
+            except aiohttp.ClientError as e:
+                print(f"  Network or API error fetching chunk {chunk_label}: {e}")
+                return None
+            except asyncio.TimeoutError:
+                print(f"  Timed out fetching chunk {chunk_label}.")
+                return None
+            except orjson.JSONDecodeError as e:
+                print(f"  Error: Could not decode response for chunk {chunk_label}: {e}")
+                return None
+    return None
+
+
+async def fetch_all_candle_chunks(
+    symbol: str,
+    resolution: str,
+    chunk_windows: list,
+    limit_per_request: int
+) -> list[Optional[list]]:
+    """
+    Fetches all candle windows concurrently and returns their results in window order.
+
+    Returns:
+        list[Optional[list]]: One entry per window: its candles, or None if that window
+                              could not be fetched (see fetch_candle_chunk).
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    rate_limit = {'resume_at': 0.0} # Shared across workers; see wait_for_rate_limit
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS)
+    timeout = aiohttp.ClientTimeout(total=10) # Per-request timeout, as with requests.get
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*(
+            fetch_candle_chunk(session, semaphore, rate_limit, symbol, resolution, chunk_start, chunk_end, limit_per_request)
+            for chunk_start, chunk_end in chunk_windows
+        ))
 
 
 def get_ohlc_data_paginated(
@@ -139,8 +405,6 @@ def get_ohlc_data_paginated(
         pd.DataFrame: A DataFrame with OHLCV data, or an empty DataFrame if an error occurs or no data.
                       Columns: 'time' (datetime), 'open', 'high', 'low', 'close', 'volume'.
     """
-    all_candles = []
-    
     overall_start_timestamp = int(start_time_dt.timestamp())
     overall_end_timestamp = int(end_time_dt.timestamp())
 
@@ -148,80 +412,121 @@ def get_ohlc_data_paginated(
     print(f"  Requested Range: {start_time_dt.strftime('%Y-%m-%d %H:%M:%S UTC')} to {end_time_dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print(f"  (Note: Delta Exchange historical data is generally available from March 30, 2020 onwards.)")
 
-    current_chunk_start_timestamp = overall_start_timestamp
+    if resolution not in RESOLUTION_SECONDS:
+        print(f"  Error: Unsupported resolution '{resolution}'. Supported: {list(RESOLUTION_SECONDS)}")
+        return pd.DataFrame()
 
-    while current_chunk_start_timestamp <= overall_end_timestamp:
-        try:
-            print(f"  Fetching chunk from {datetime.fromtimestamp(current_chunk_start_timestamp, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}...")
-            
-            params = {
-                'symbol': symbol,
-                'resolution': resolution,
-                'start': current_chunk_start_timestamp,
-                'end': overall_end_timestamp,
-                'limit': limit_per_request
-            }
-
-            response = requests.get(
-                f"{BASE_URL}/v2/history/candles", 
-                params=params, 
-                timeout=10 # Set a timeout for the request
-            )
-            response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
-            
-            json_response = response.json()
-            
-            if 'result' in json_response and isinstance(json_response['result'], list):
-                candles_page = json_response['result']
-            else:
-                print(f"  Error: Unexpected response format. Expected 'result' key with a list. Received: {json_response}. Breaking fetch.")
-                break
-
-            if not candles_page:
-                print("  No more candles found in this segment or within the valid range. Ending fetch.")
-                break
-
-            all_candles.extend(candles_page)
-            print(f"  Fetched {len(candles_page)} candles in this chunk. Total so far: {len(all_candles)}")
-            
-            last_candle_time = candles_page[-1]['time']
-            
-            if last_candle_time >= overall_end_timestamp:
-                print("  Reached or surpassed the overall end time. Ending fetch.")
-                break
+    # Each window holds at most `limit_per_request` candles, so the chunks are
+    # independent of each other and can be requested concurrently.
+    chunk_span = limit_per_request * RESOLUTION_SECONDS[resolution]
+    chunk_windows = [
+        (chunk_start, min(chunk_start + chunk_span - 1, overall_end_timestamp))
+        for chunk_start in range(overall_start_timestamp, overall_end_timestamp + 1, chunk_span)
+    ]
+    print(f"  Dispatching {len(chunk_windows)} chunk request(s) with up to {MAX_CONCURRENT_REQUESTS} in flight...")
+
+    # asyncio.run() cannot start a loop inside one that is already running (e.g. Jupyter);
+    # fail loudly here rather than reporting that no data was found.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "get_ohlc_data_paginated() cannot be called from a running event loop (e.g. Jupyter). "
+            "Await fetch_all_candle_chunks() directly instead."
+        )
 
-            current_chunk_start_timestamp = last_candle_time + 1
-            
-            if len(candles_page) < limit_per_request:
-                print("  Less than limit received, likely fetched all candles in the remaining range. Ending fetch.")
-                break
+    # uvloop.run() picks the right way to start uvloop's event loop on every supported
+    # Python version; without uvloop, use asyncio's default loop.
+    run = uvloop.run if uvloop is not None else asyncio.run
 
-            time.sleep(0.1) 
+    try:
+        chunk_results = run(
+            fetch_all_candle_chunks(symbol, resolution, chunk_windows, limit_per_request)
+        )
+    except Exception as e:
+        print(f"  An unexpected error occurred during pagination: {e}")
+        return pd.DataFrame()
 
-        except requests.exceptions.RequestException as e:
-            print(f"  Network or API error during pagination: {e}")
-            break
-        except Exception as e:
-            print(f"  An unexpected error occurred during pagination: {e}")
-            break
-
-    if all_candles:
-        df = pd.DataFrame(all_candles)
-        df['time'] = pd.to_datetime(df['time'], unit='s', utc=True)
-        df.drop_duplicates(subset=['time'], inplace=True)
-        df.sort_values(by='time', inplace=True)
-        
-        df = df[(df['time'] >= start_time_dt) & (df['time'] <= end_time_dt)].copy()
-        
-        output_df = df[['time', 'open', 'high', 'low', 'close', 'volume']]
-        return output_df
+    # A failed window would leave a silent gap in the middle of the series, so any
+    # failure discards the whole fetch instead of returning partial data.
+    failed_windows = [window for window, candles_page in zip(chunk_windows, chunk_results) if candles_page is None]
+    if failed_windows:
+        print(f"  Error: {len(failed_windows)} of {len(chunk_windows)} chunk(s) could not be fetched:")
+        for chunk_start, chunk_end in failed_windows:
+            print(f"    {datetime.fromtimestamp(chunk_start, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} to "
+                  f"{datetime.fromtimestamp(chunk_end, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        print("  Discarding partial data to avoid gaps in the series.")
+        return pd.DataFrame()
+
+    # All chunks are back by now, so the buffer can be sized exactly once and each
+    # chunk written into its slice; no per-candle list growth or re-scan.
+    candle_count = sum(len(candles_page) for candles_page in chunk_results)
+    candle_buffer = np.empty(candle_count, dtype=CANDLE_DTYPE)
+    offset = 0
+    for candles_page in chunk_results:
+        page_size = len(candles_page)
+        if page_size:
+            # A single C-level itemgetter pass pulls all six fields per candle and zip(*)
+            # transposes them into columns; numpy then casts each column (including numbers
+            # sent as strings) to its buffer dtype without a Python call per value.
+            page_slice = candle_buffer[offset:offset + page_size]
+            page_columns = zip(*map(CANDLE_FIELD_GETTER, candles_page))
+            for field, values in zip(CANDLE_DTYPE.names, page_columns):
+                page_slice[field] = np.array(values, dtype=CANDLE_DTYPE[field])
+            offset += page_size
+    print(f"  Total candles fetched: {candle_count}")
+
+    if candle_count:
+        # Chunk windows never overlap, so no candle can arrive twice; only ordering is needed.
+        keep_idx = np.argsort(candle_buffer['time'], kind='stable')
+        times = candle_buffer['time'][keep_idx]
+        assert np.all(np.diff(times) > 0), "Duplicate candle timestamps across chunk windows"
+
+        # Trim to the requested range on the raw timestamps, before any DataFrame exists.
+        in_range = (times >= overall_start_timestamp) & (times <= overall_end_timestamp)
+        times = times[in_range]
+        keep_idx = keep_idx[in_range]
+
+        # Direct int64 -> datetime64 cast; skips the generic pd.to_datetime parsing path.
+        time_index = pd.DatetimeIndex(times.astype('datetime64[s]').astype('datetime64[ns]'), tz='UTC')
+        columns = {'time': time_index}
+        for field in CANDLE_VALUE_FIELDS:
+            columns[field] = candle_buffer[field][keep_idx]
+        # `columns` is already in output order: time, open, high, low, close, volume.
+        return pd.DataFrame(columns)
     
     return pd.DataFrame()
 
 
-def get_user_input_symbol(available_symbols: set) -> str:
+def save_ohlc_data(df: pd.DataFrame, output_filename: str) -> None:
+    """
+    Saves OHLC data to disk. Files ending in '.parquet' are written as zstd-compressed
+    Parquet; anything else is written as CSV through pyarrow's multithreaded writer.
+
+    Args:
+        df (pd.DataFrame): The OHLC DataFrame to save.
+        output_filename (str): Destination path.
+    """
+    if output_filename.lower().endswith('.parquet'):
+        df.to_parquet(output_filename, index=False, compression='zstd')
+    else:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if 'time' in table.column_names:
+            # Write UTC timestamps as plain 'YYYY-MM-DD HH:MM:SS', matching 'Output preview'.
+            # Casting to a naive timestamp first avoids a time zone database lookup in strftime.
+            time_idx = table.column_names.index('time')
+            naive_times = table['time'].cast(pa.timestamp('s'))
+            table = table.set_column(time_idx, 'time', pc.strftime(naive_times, format='%Y-%m-%d %H:%M:%S'))
+        write_options = pv.WriteOptions(quoting_style='none', quoting_header='none')
+        pv.write_csv(table, output_filename, write_options=write_options)
+
+
+def get_user_input_symbol(available_symbols: frozenset, examples: list, count: int) -> str:
     """
     Prompts the user to input a trading symbol and validates it.
+    `examples` and `count` are computed once by the caller so retries stay O(1).
     """
     while True:
         user_symbol = input("\nEnter the trading symbol (e.g., BTCUSD, ETHUSD): ").strip().upper()
@@ -229,9 +534,9 @@ def get_user_input_symbol(available_symbols: set) -> str:
             return user_symbol
         else:
             print(f"Error: '{user_symbol}' is not a valid or currently listed symbol. Please try again.")
-            print(f"Available symbols count: {len(available_symbols)}")
-            if len(available_symbols) > 0:
-                print("Some examples:", list(available_symbols)[:5]) # Show a few examples
+            print(f"Available symbols count: {count}")
+            if count > 0:
+                print("Some examples:", examples) # Show a few examples
 
 def get_user_input_date_range() -> tuple[datetime, datetime]:
     """
@@ -250,21 +555,18 @@ def get_user_input_date_range() -> tuple[datetime, datetime]:
                 print("Error: Start year cannot be after end year.")
                 continue
 
+            end_date_obj = datetime(end_year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+            if end_date_obj < DELTA_EPOCH:
+                print("Error: Delta Exchange historical data starts from March 30, 2020. End year must be 2020 or later.")
+                continue
+
             # Delta Exchange historical data generally available from March 30, 2020 onwards.
-            # Give a warning if the requested range starts before this.
-            if start_year < 2020: # Or more specifically 2020, 3, 30
+            # Clamp the start there so no requests are spent on pre-epoch chunks.
+            start_date_obj = datetime(start_year, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+            if start_date_obj < DELTA_EPOCH:
                 print("\nWarning: Delta Exchange historical data generally starts from March 30, 2020.")
-                print("         You may not get data for years before this date.")
-                # Adjust start_date_obj to March 30, 2020 if the user enters a much earlier year
-                if start_year < 2020:
-                     print("         Adjusting start to 2020-03-30 for maximum available history.")
-                     # We still set it to the user's start_year, but this warns them
-                     # The actual API call will get data from 2020-03-30 if available.
-                start_date_obj = datetime(start_year, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-            else:
-                start_date_obj = datetime(start_year, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-            
-            end_date_obj = datetime(end_year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+                print("         Adjusting start to 2020-03-30 for maximum available history.")
+                start_date_obj = DELTA_EPOCH
 
             # Ensure end_date_obj doesn't exceed current time to avoid requesting future data
             current_utc_time = datetime.now(timezone.utc)
@@ -287,14 +589,16 @@ if __name__ == "__main__":
 
     # 1. Get list of all available symbols for validation
     all_products = get_all_products(BASE_URL)
-    available_symbols_set = {p['symbol'] for p in all_products} if all_products else set()
+    available_symbols_set = frozenset(p['symbol'] for p in all_products) if all_products else frozenset()
 
     if not available_symbols_set:
         print("Could not retrieve list of available symbols. Exiting.")
         exit()
 
     # 2. Get symbol input from user
-    target_symbol = get_user_input_symbol(available_symbols_set)
+    symbol_examples = list(available_symbols_set)[:5]
+    symbol_count = len(available_symbols_set)
+    target_symbol = get_user_input_symbol(available_symbols_set, symbol_examples, symbol_count)
     target_resolution = "1d" # Fixed to daily candles as per earlier discussions
 
     # 3. Get date range input from user
@@ -327,7 +631,7 @@ if __name__ == "__main__":
         output_filename = f"{target_symbol}_{target_resolution}_{start_str}_{end_str}_ohlc.csv"
         
         try:
-            ohlc_df.to_csv(output_filename, index=False)
+            save_ohlc_data(ohlc_df, output_filename)
             print(f"\n--- Data successfully saved to {output_filename} ---")
         except Exception as e:
             print(f"\nError saving data to CSV: {e}")